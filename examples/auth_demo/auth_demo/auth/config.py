@@ -16,11 +16,13 @@
 
 """Configuration of the auth context."""
 
-__all__ = ["DemoAuthContext", "DemoAuthConfig"]
+__all__ = ["DemoAuthContext", "DemoAuthConfig", "get_auth_key_pair"]
 
+from functools import cached_property, lru_cache
 from typing import Any, cast
 
-from pydantic import BaseModel, Field
+from jwcrypto.jwk import JWK
+from pydantic import BaseModel, ConfigDict, Field
 
 from ghga_service_commons.auth.jwt_auth import JWTAuthConfig
 from ghga_service_commons.utils.jwt_helpers import generate_jwk
@@ -30,31 +32,55 @@ from ghga_service_commons.utils.utc_dates import UTCDatetime
 class DemoAuthContext(BaseModel):
     """Example auth context."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(default=..., description="The name of the user")
     expires: UTCDatetime = Field(
         default=..., description="The expiration date of this context"
     )
     is_vip: bool = Field(default=False, description="Whether the user is a VIP")
 
+    @cached_property
+    def expires_str(self) -> str:
+        """The expiration date formatted as an ISO string.
+
+        Since the context is immutable, the string is computed only once.
+        """
+        return self.expires.isoformat()
+
+
+@lru_cache
+def get_auth_key_pair() -> JWK:
+    """Get a key pair for signing and validating JSON web tokens.
+
+    The key pair is created lazily upon first use and then cached,
+    so that importing this module stays cheap.
+    """
+    return generate_jwk()
+
 
-# create a key pair for signing and validating JSON web tokens
-AUTH_KEY_PAIR = generate_jwk()
+# prebuilt defaults for the claims fields below; the bound copy methods
+# serve as factories that shallow-copy instead of pydantic's deep-copy path
+_CHECK_CLAIMS: dict[str, Any] = {"name": None, "exp": None}
+_MAP_CLAIMS: dict[str, str] = {"exp": "expires"}
 
 
 class DemoAuthConfig(JWTAuthConfig):
     """Config parameters and their defaults for the example auth context."""
 
     auth_key: str = Field(
-        default=cast(str, AUTH_KEY_PAIR.export(private_key=False)),
+        default_factory=lambda: cast(
+            str, get_auth_key_pair().export(private_key=False)
+        ),
         description="The public key for validating the token signature.",
     )
     auth_check_claims: dict[str, Any] = Field(
-        default={"name": None, "exp": None},
+        default_factory=_CHECK_CLAIMS.copy,
         description="A dict of all claims that shall be verified by the provider."
         + " A value of None means that the claim can have any value.",
     )
     auth_map_claims: dict[str, str] = Field(
-        default={"exp": "expires"},
+        default_factory=_MAP_CLAIMS.copy,
         description="A mapping of claims to attributes in the auth context."
         + " Only differently named attributes must be specified."
         + " The value None can be used to exclude claims from the auth context.",
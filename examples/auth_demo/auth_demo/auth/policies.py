@@ -19,7 +19,8 @@
 See the router.py module for how to use these policies in REST endpoints.
 """
 
-from typing import Annotated, Optional
+from operator import attrgetter
+from typing import Annotated, Callable, Optional
 
 from fastapi import Depends, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -33,38 +34,58 @@ from ghga_service_commons.auth.policies import (
 
 __all__ = ["OptionalAuthContext", "UserAuthContext", "VipAuthContext"]
 
-
-async def get_auth_context(
-    auth_provider: AuthProviderDummy,
-    credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False)),
-) -> Optional[DemoAuthContext]:
-    """Get an authentication and authorization context using FastAPI."""
-    context = await get_auth_context_using_credentials(credentials, auth_provider)
-    return context  # workaround mypy issue #12156
-
-
-async def require_auth_context(
-    auth_provider: AuthProviderDummy,
-    credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=True)),
-) -> DemoAuthContext:
-    """Require an authentication and authorization context using FastAPI."""
-    return await require_auth_context_using_credentials(credentials, auth_provider)
-
-
-def check_vip(context: DemoAuthContext) -> bool:
-    """Check if the given auth context belongs to a VIP."""
-    return context.is_vip
-
-
-async def require_vip_context(
-    auth_provider: AuthProviderDummy,
-    credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=True)),
-) -> DemoAuthContext:
-    """Require a VIP authentication and authorization context using FastAPI."""
-    return await require_auth_context_using_credentials(
-        credentials, auth_provider, check_vip
-    )
-
+# shared security scheme instances
+# (instantiating these once lets FastAPI reuse the dependency across policies)
+_BEARER_OPTIONAL = HTTPBearer(auto_error=False)
+_BEARER_REQUIRED = HTTPBearer(auto_error=True)
+
+# check whether the given auth context belongs to a VIP
+# (a C-level attribute getter avoids a Python function call per request)
+check_vip = attrgetter("is_vip")
+
+
+def _make_policy(
+    *,
+    require: bool = True,
+    predicate: Optional[Callable[[DemoAuthContext], bool]] = None,
+) -> Callable:
+    """Create a policy dependency for getting or requiring an auth context.
+
+    All policies share this single implementation so that FastAPI only needs
+    to build one dependency graph shape for all of them.
+    """
+    if require:
+        bearer = Depends(_BEARER_REQUIRED)
+        check = predicate or (lambda _context: True)
+
+        async def policy(
+            auth_provider: AuthProviderDummy,
+            credentials: HTTPAuthorizationCredentials = bearer,
+        ) -> DemoAuthContext:
+            """Require an authentication and authorization context using FastAPI."""
+            return await require_auth_context_using_credentials(
+                credentials, auth_provider, check
+            )
+
+    else:
+        bearer = Depends(_BEARER_OPTIONAL)
+
+        async def policy(  # type: ignore[misc]
+            auth_provider: AuthProviderDummy,
+            credentials: HTTPAuthorizationCredentials = bearer,
+        ) -> Optional[DemoAuthContext]:
+            """Get an authentication and authorization context using FastAPI."""
+            context = await get_auth_context_using_credentials(
+                credentials, auth_provider
+            )
+            return context  # workaround mypy issue #12156
+
+    return policy
+
+
+get_auth_context = _make_policy(require=False)
+require_auth_context = _make_policy()
+require_vip_context = _make_policy(predicate=check_vip)
 
 # policy for getting an auth token without requiring its existence
 OptionalAuthContext = Annotated[Optional[DemoAuthContext], Security(get_auth_context)]
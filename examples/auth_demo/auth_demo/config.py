@@ -16,12 +16,20 @@
 
 """Config parameters."""
 
+from functools import lru_cache
+
 from auth_demo.auth.config import DemoAuthConfig
 from auth_demo.core import HangoutConfig
 from ghga_service_commons.api import ApiConfigBase
 
-__all__ = ["Config"]
+__all__ = ["Config", "get_config"]
 
 
 class Config(ApiConfigBase, DemoAuthConfig, HangoutConfig):
     """Config parameters and their defaults."""
+
+
+@lru_cache
+def get_config() -> Config:
+    """Get the cached config instance."""
+    return Config()
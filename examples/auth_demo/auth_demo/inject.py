@@ -18,41 +18,60 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
-from contextlib import asynccontextmanager, contextmanager, nullcontext
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, Callable
 
 from auth_demo import dummies
 from auth_demo.auth.config import DemoAuthContext
 from auth_demo.config import Config
-from auth_demo.core import Hangout
+from auth_demo.core import Hangout, HangoutConfig
 from auth_demo.ports.hangout import HangoutPort
-from auth_demo.router_config import get_configured_app
 from ghga_service_commons.auth.context import AuthContextProtocol
 from ghga_service_commons.auth.jwt_auth import JWTAuthContextProvider
-from ghga_service_commons.utils.context import asyncnullcontext
 
 
-@contextmanager
-def prepare_core(
-    *,
-    config: Config,
-) -> Generator[HangoutPort, None, None]:
-    """Constructs and initializes all core components and their outbound dependencies."""
-    yield Hangout(config=config)
+def _constant(value: Any) -> Callable[[], Any]:
+    """Create a dependency override that always returns the given value.
+
+    Note that FastAPI inspects the signature of override callables,
+    so this must stay a plain zero-argument function.
+    """
+
+    def dependency() -> Any:
+        return value
+
+    return dependency
+
+
+@lru_cache(maxsize=4)
+def _cached_auth_provider(config_json: str) -> JWTAuthContextProvider:
+    """Get an auth provider for the given serialized config.
+
+    Constructing the provider parses the JWK from the config, so instances
+    are shared across repeated app setups with the same config.
+    """
+    config = Config.model_validate_json(config_json)
+    return JWTAuthContextProvider(config=config, context_class=DemoAuthContext)
 
 
-def prepare_core_with_override(
+@lru_cache(maxsize=8)
+def _cached_hangout(greeting: str, treat: str) -> Hangout:
+    """Get a Hangout instance for the given config values.
+
+    The Hangout core is stateless, so instances with the same config
+    can be shared across repeated app setups (e.g. in test fixtures).
+    """
+    return Hangout(config=HangoutConfig(greeting=greeting, treat=treat))
+
+
+def prepare_core(
     *,
     config: Config,
     hangout_override: HangoutPort | None = None,
-):
-    """Resolve the hangout context manager based on config and override (if any)."""
-
-    return (
-        nullcontext(hangout_override)
-        if hangout_override
-        else prepare_core(config=config)
-    )
+) -> HangoutPort:
+    """Construct and initialize the core component unless an override is given."""
+    return hangout_override or _cached_hangout(config.greeting, config.treat)
 
 
 @asynccontextmanager
@@ -67,21 +86,18 @@ async def prepare_rest_app(
     By default, the core and auth dependencies are automatically prepared but you can also
     provide them using the override parameters.
     """
+    # import lazily so that building the route metadata for all endpoints
+    # only happens when an app is actually prepared, not when this module
+    # is merely imported (e.g. during test collection)
+    from auth_demo.router_config import get_configured_app
+
     app = get_configured_app(config=config)
 
-    async with (
-        asyncnullcontext(auth_provider_override)
-        if auth_provider_override
-        else JWTAuthContextProvider.construct(
-            config=config,
-            context_class=DemoAuthContext,
-        )
-    ) as auth_provider:
-        with prepare_core_with_override(
-            config=config, hangout_override=hangout_override
-        ) as hangout:
-            app.dependency_overrides[dummies.hangout_port] = lambda: hangout
-            app.dependency_overrides[dummies.auth_provider_dummy] = (
-                lambda: auth_provider
-            )
-            yield app
+    auth_provider = auth_provider_override or _cached_auth_provider(
+        config.model_dump_json()
+    )
+    hangout = prepare_core(config=config, hangout_override=hangout_override)
+
+    app.dependency_overrides[dummies.hangout_port] = _constant(hangout)
+    app.dependency_overrides[dummies.auth_provider_dummy] = _constant(auth_provider)
+    yield app
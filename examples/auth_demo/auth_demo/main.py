@@ -18,15 +18,18 @@
 
 import asyncio
 
-from auth_demo.config import Config
-from auth_demo.inject import prepare_rest_app
-from ghga_service_commons.api import run_server
 from ghga_service_commons.utils.utc_dates import assert_tz_is_utc
 
 
 async def configure_and_run_server():
     """Run the HTTP API."""
-    config = Config()
+    # import here to delay the heavy FastAPI and auth imports
+    # until the server is actually started
+    from auth_demo.config import get_config
+    from auth_demo.inject import prepare_rest_app
+    from ghga_service_commons.api import run_server
+
+    config = get_config()
     async with prepare_rest_app(config=config) as app:
         await run_server(app=app, config=config)
 
@@ -34,4 +37,10 @@ async def configure_and_run_server():
 def run():
     """Main entry point for running the server."""
     assert_tz_is_utc()
+    try:  # use the faster uvloop event loop if available
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(configure_and_run_server())
@@ -16,11 +16,11 @@
 
 """FastAPI router for the example application."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from auth_demo.auth.policies import OptionalAuthContext, UserAuthContext, VipAuthContext
 from auth_demo.dummies import HangoutDummy
-from auth_demo.users import create_example_users
+from auth_demo.users import get_example_users_body
 
 router = APIRouter()
 
@@ -37,7 +37,8 @@ async def root():
 @router.get("/users")
 async def users():
     """Return a list of users with tokens for testing."""
-    return {"users": create_example_users()}
+    # serve the pre-serialized body to avoid re-encoding it per request
+    return Response(content=get_example_users_body(), media_type="application/json")
 
 
 @router.get("/status")
@@ -45,8 +46,9 @@ async def status(
     auth_context: OptionalAuthContext,
 ):
     """This endpoint shows the current login status."""
-    expires = str(auth_context.expires) if auth_context else None
-    return {"status": f"logged in until {expires}" if expires else "logged out"}
+    if not auth_context:
+        return {"status": "logged out"}
+    return {"status": f"logged in until {auth_context.expires_str}"}
 
 
 @router.get("/reception")
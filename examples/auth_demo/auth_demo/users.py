@@ -16,10 +16,15 @@
 
 """Create access tokens for testing."""
 
-from typing import NamedTuple
+import json
+from typing import NamedTuple, Optional
 
-from auth_demo.auth.config import AUTH_KEY_PAIR
+from auth_demo.auth.config import get_auth_key_pair
 from ghga_service_commons.utils.jwt_helpers import sign_and_serialize_token
+from ghga_service_commons.utils.utc_dates import now_as_utc
+
+# how long the tokens of the example users shall be valid
+TOKEN_VALID_SECONDS = 60 * 10
 
 
 class UserInfo(NamedTuple):
@@ -40,6 +45,45 @@ EXAMPLE_USERS: list[UserInfo] = [
 def create_example_users() -> list[dict]:
     """Create a couple of example users for the application."""
     users = [user._asdict() for user in EXAMPLE_USERS]
+    key_pair = get_auth_key_pair()
     for user in users:
-        user["token"] = sign_and_serialize_token(user, AUTH_KEY_PAIR)
+        user["token"] = sign_and_serialize_token(
+            user, key_pair, valid_seconds=TOKEN_VALID_SECONDS
+        )
     return users
+
+
+_users_cache: Optional[tuple[float, list[dict], bytes]] = None
+
+
+def _get_cached_users() -> tuple[float, list[dict], bytes]:
+    """Get the cached example users, re-creating them when necessary.
+
+    Signing the tokens is the most expensive operation in this app, so the
+    users are cached and only re-created when half of the token validity
+    has elapsed. The serialized response body for the /users endpoint is
+    cached alongside so it does not need to be re-encoded per request.
+    """
+    global _users_cache
+    now = now_as_utc().timestamp()
+    if _users_cache is None or now > _users_cache[0]:
+        users = create_example_users()
+        body = json.dumps({"users": users}).encode("utf-8")
+        _users_cache = (now + TOKEN_VALID_SECONDS / 2, users, body)
+    return _users_cache
+
+
+def get_example_users() -> list[dict]:
+    """Get the example users, reusing already signed tokens."""
+    return _get_cached_users()[1]
+
+
+def get_example_users_body() -> bytes:
+    """Get the example users as a pre-serialized JSON response body."""
+    return _get_cached_users()[2]
+
+
+def refresh_example_users() -> None:
+    """Discard the cached example users so they are re-created on next access."""
+    global _users_cache
+    _users_cache = None
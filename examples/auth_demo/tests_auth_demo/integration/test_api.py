@@ -16,27 +16,27 @@
 
 """Test the REST API."""
 
-import asyncio
+import re
 
 import pytest
-from fastapi import FastAPI, status
+import pytest_asyncio
+from fastapi import status
 
 from auth_demo.config import Config
 from auth_demo.inject import prepare_rest_app
 from ghga_service_commons.api.testing import AsyncTestClient
 
 
-async def get_app() -> FastAPI:
-    """Get the demo app."""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Get test client for the demo app."""
     config = Config()
     async with prepare_rest_app(config=config) as app:
-        return app
+        yield AsyncTestClient(app)
 
 
-@pytest.fixture
-def client() -> AsyncTestClient:
-    """Get test client for the demo app."""
-    return AsyncTestClient(asyncio.run(get_app()))
+# a serialized JWT consists of three base64url encoded segments
+_JWT_RE = re.compile(r"[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+")
 
 
 def get_token(users: list[dict], name: str) -> str:
@@ -49,10 +49,7 @@ def get_token(users: list[dict], name: str) -> str:
     assert "is_vip" in user
     token = user["token"]
     assert len(token) > 80
-    assert token.count(".") == 2
-    chars = token.replace(".", "").replace("-", "").replace("_", "")
-    assert chars.isalnum()
-    assert chars.isascii()
+    assert _JWT_RE.fullmatch(token)
     return token
 
 
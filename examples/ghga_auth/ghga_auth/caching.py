@@ -0,0 +1,82 @@
+# Copyright 2021 - 2024 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""A caching decorator for auth context providers."""
+
+from __future__ import annotations
+
+from hashlib import sha256
+
+from pydantic import ConfigDict
+
+from ghga_service_commons.auth.context import AuthContextProtocol
+from ghga_service_commons.auth.ghga import AuthContext
+from ghga_service_commons.utils.utc_dates import now_as_utc
+
+__all__ = ["CachingAuthContextProvider", "HashableAuthContext"]
+
+
+class HashableAuthContext(AuthContext):
+    """An immutable and therefore hashable variant of the GHGA auth context.
+
+    Being hashable allows derived per-context values (like serialized
+    representations) to be cached downstream.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
+class CachingAuthContextProvider(AuthContextProtocol[AuthContext]):
+    """Wrap an auth context provider with a bounded token verification cache.
+
+    Verifying the token signature on every request is CPU-bound, but the
+    derived context is invariant for a given token. Successfully verified
+    contexts are therefore cached keyed by a SHA-256 digest of the bearer
+    token (so that raw tokens are never retained) and reused until the
+    token itself expires. Invalid tokens are never cached.
+    """
+
+    def __init__(
+        self,
+        provider: AuthContextProtocol[AuthContext],
+        *,
+        max_size: int = 1024,
+    ):
+        """Initialize with the wrapped provider and a maximum cache size."""
+        self._provider = provider
+        self._max_size = max_size
+        self._cache: dict[bytes, tuple[float, AuthContext]] = {}
+
+    async def get_context(self, token: str) -> AuthContext | None:
+        """Get the auth context for the token, reusing cached verifications.
+
+        Raises an AuthContextValidationError if the provided token cannot
+        establish a valid authentication and authorization context.
+        """
+        key = sha256(token.encode()).digest()
+        entry = self._cache.get(key)
+        if entry:
+            expires, cached_context = entry
+            if expires > now_as_utc().timestamp():
+                return cached_context
+            del self._cache[key]
+        context = await self._provider.get_context(token)
+        if context is not None:
+            if len(self._cache) >= self._max_size:
+                # evict the oldest entry (dicts keep insertion order)
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = (context.exp.timestamp(), context)
+        return context
@@ -27,13 +27,18 @@ from ghga_service_commons.utils.jwt_helpers import generate_jwk
 __all__ = ["Config"]
 
 # create a key pair for signing and validating JSON web tokens
+# (pass this parsed object to signing helpers instead of re-parsing
+# the key from its serialized form)
 AUTH_KEY_PAIR = generate_jwk()
 
+# the serialized public key, exported exactly once at import time
+AUTH_PUBLIC_KEY_JSON = cast(str, AUTH_KEY_PAIR.export(private_key=False))
+
 
 class Config(ApiConfigBase, AuthConfig):
     """Config parameters and their defaults."""
 
     auth_key: str = Field(
-        default=cast(str, AUTH_KEY_PAIR.export(private_key=False)),
+        default=AUTH_PUBLIC_KEY_JSON,
         description="The GHGA internal public key for validating the token signature.",
     )
@@ -21,6 +21,7 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 
 from ghga_auth import dummies
+from ghga_auth.caching import CachingAuthContextProvider, HashableAuthContext
 from ghga_auth.config import Config
 from ghga_auth.router_config import get_configured_app
 from ghga_service_commons.auth.context import AuthContextProtocol
@@ -46,8 +47,12 @@ async def prepare_rest_app(
         if auth_provider_override
         else GHGAAuthContextProvider.construct(
             config=config,
-            context_class=AuthContext,
+            context_class=HashableAuthContext,
         )
     ) as auth_provider:
+        if not auth_provider_override:
+            # cache verified tokens so repeated requests with the same
+            # bearer token skip the expensive signature verification
+            auth_provider = CachingAuthContextProvider(auth_provider)
         app.dependency_overrides[dummies.auth_provider_dummy] = lambda: auth_provider
         yield app
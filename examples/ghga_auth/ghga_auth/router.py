@@ -16,26 +16,60 @@
 
 """FastAPI router for the GHGA auth example application."""
 
-from fastapi import APIRouter
+from functools import lru_cache
 
+import orjson
+from fastapi import APIRouter, Response
+
+from ghga_auth.caching import HashableAuthContext
 from ghga_auth.policies import AdminAuthContext, OptionalAuthContext, UserAuthContext
+from ghga_service_commons.auth.ghga import AuthContext
 
 router = APIRouter()
 
+# precomputed body for unauthenticated requests
+_NO_CONTEXT_BODY = orjson.dumps({"context": None})
+
+
+@lru_cache(maxsize=1024)
+def _context_body(context: HashableAuthContext) -> bytes:
+    """Get the serialized response body for the given auth context.
+
+    This relies on the context being the hashable variant that the app
+    is wired with; repeated requests with the same token then reuse the
+    JSON bytes, skipping both the model dump and the JSON encoding.
+    """
+    return orjson.dumps({"context": context.model_dump(mode="json")})
+
+
+def _context_response(context: AuthContext | None) -> Response:
+    """Build a raw JSON response for the given auth context.
+
+    Only hashable contexts go through the body cache; plain contexts
+    (e.g. from an overridden auth provider) are serialized directly.
+    """
+    if context is None:
+        body = _NO_CONTEXT_BODY
+    elif isinstance(context, HashableAuthContext):
+        body = _context_body(context)
+    else:
+        body = orjson.dumps({"context": context.model_dump(mode="json")})
+    return Response(content=body, media_type="application/json")
+
 
 @router.get("/get_auth")
 async def get_auth_route(context: OptionalAuthContext):
     """Get and return auth context without requiring it."""
-    return {"context": context.model_dump() if context else None}
+    return _context_response(context)
 
 
 @router.get("/require_auth")
 async def require_auth_route(context: UserAuthContext):
     """Require and return auth context."""
-    return {"context": context.model_dump()}
+    return _context_response(context)
 
 
 @router.get("/require_admin")
 async def require_admin_route(context: AdminAuthContext):
     """Require and return auth context with admin role."""
-    return {"context": context.model_dump()}
+    return _context_response(context)
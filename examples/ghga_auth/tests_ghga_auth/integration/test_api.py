@@ -16,9 +16,10 @@
 
 """Test the REST API."""
 
-import asyncio
+from functools import lru_cache
 
 import pytest
+import pytest_asyncio
 from fastapi import status
 
 from ghga_auth.config import AUTH_KEY_PAIR, Config
@@ -27,22 +28,17 @@ from ghga_service_commons.api.testing import AsyncTestClient
 from ghga_service_commons.utils.jwt_helpers import sign_and_serialize_token
 
 
-async def get_app():
-    """Get the demo app."""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Get test client for the demo app."""
     config = Config()  # pyright: ignore
-
     async with prepare_rest_app(config=config) as app:
-        return app
-
-
-@pytest.fixture
-def client() -> AsyncTestClient:
-    """Get test client for the demo app."""
-    return AsyncTestClient(asyncio.run(get_app()))
+        yield AsyncTestClient(app)
 
 
-def get_headers(admin: bool = False) -> dict[str, str]:
-    """Get a request header with an auth token for testing."""
+@lru_cache(maxsize=8)
+def _token(admin: bool = False) -> str:
+    """Get an auth token for testing, signing it only once per claim set."""
     claims = {
         "name": "John Doe",
         "email": "john@home.org",
@@ -51,8 +47,16 @@ def get_headers(admin: bool = False) -> dict[str, str]:
     }
     if admin:
         claims["role"] = "admin"
-    token = sign_and_serialize_token(claims, AUTH_KEY_PAIR)
-    return {"Authorization": f"Bearer {token}"}
+    return sign_and_serialize_token(claims, AUTH_KEY_PAIR)
+
+
+@lru_cache(maxsize=8)
+def get_headers(admin: bool = False) -> dict[str, str]:
+    """Get a request header with an auth token for testing.
+
+    The same dict is returned for repeated calls; callers must not mutate it.
+    """
+    return {"Authorization": f"Bearer {_token(admin)}"}
 
 
 @pytest.mark.asyncio
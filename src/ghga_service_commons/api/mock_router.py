@@ -18,13 +18,12 @@
 from __future__ import annotations
 
 import re
-from functools import partial
-from inspect import signature
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from typing import Any, Callable, Generic, TypeVar, cast, get_type_hints
 
 import httpx
 import pytest
-from pydantic import BaseModel
 
 from ghga_service_commons.httpyexpect.server.exceptions import HttpException
 
@@ -34,31 +33,53 @@ __all__ = [
     "HttpException",
 ]
 
-BRACKET_PATTERN = re.compile(r"{.*?}")
+# matches a {variable} path segment, capturing the variable name
+BRACKET_PATTERN = re.compile(r"\{([^{}]*)\}")
 
 
+@lru_cache(maxsize=1024)
 def _compile_regex_url(path: str) -> str:
     """Given a path, compile a url pattern regex that matches named groups where specified.
 
-    e.g. "/work-packages/{package_id}" would become "/work-packages/(?P<package_id>[^/]+)$"
-    And when a request URL like /work-packages/12 is matched against the regex-url above,
+    e.g. "/work-packages/{package_id}" would become "^/work-packages/(?P<package_id>[^/]+)$"
+    And when a request path like /work-packages/12 is matched against the regex-url above,
     the match object will have a .groupdict() of {"package_id": "12"}
 
+    The literal parts of the path are regex-escaped so that characters like
+    "." or "+" in a path only match themselves.
+
     This function is not intended to be used outside the module.
     """
-    brackets_to_strip = "{}"
+    parts = ["^"]
+    position = 0
+    while (left_brace := path.find("{", position)) >= 0:
+        right_brace = path.find("}", left_brace + 1)
+        if right_brace < 0:
+            break
+        parts.append(re.escape(path[position:left_brace]))
+        parts.append(f"(?P<{path[left_brace + 1 : right_brace]}>[^/]+)")
+        position = right_brace + 1
+    parts.append(re.escape(path[position:]))
+    parts.append("$")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(url_pattern: str) -> re.Pattern:
+    """Compile the given url pattern, reusing compiled patterns across routers.
 
-    url = re.sub(
-        BRACKET_PATTERN,
-        repl=lambda name: f"(?P<{name.group().strip(brackets_to_strip)}>[^/]+)",
-        string=path,
-    )
-    return f"{url}$"
+    This function is not intended to be used outside the module.
+    """
+    return re.compile(url_pattern)
 
 
+@lru_cache(maxsize=1024)
 def _get_signature_info(endpoint_function: Callable) -> dict[str, Any]:
     """Retrieve the typed parameter info from function signature minus return type.
 
+    The result is cached per function so that registering the same function
+    with several routers resolves the type hints only once.
+
     This function is not intended to be used outside the module.
     """
     signature_parameters: dict[str, Any] = get_type_hints(endpoint_function)
@@ -77,12 +98,31 @@ def assert_all_responses_were_requested() -> bool:
     return False
 
 
-class RegisteredEndpoint(BaseModel):
-    """Endpoint data with the url turned into regex string to get parameters in path."""
+@dataclass
+class RegisteredEndpoint:
+    """Endpoint data with the url turned into regex string to get parameters in path.
+
+    This is an internal record created once per registration, so a plain
+    slotted dataclass is used instead of a pydantic model to keep attribute
+    access cheap in the per-request dispatch code.
+    """
+
+    __slots__ = (
+        "url_pattern",
+        "compiled_pattern",
+        "endpoint_function",
+        "signature_parameters",
+        "conversion_plan",
+        "needs_request",
+    )
 
     url_pattern: str
+    compiled_pattern: re.Pattern
     endpoint_function: Callable
     signature_parameters: dict[str, Any]
+    # per-parameter casters derived from the signature (None means str, no cast)
+    conversion_plan: list[tuple[str, Callable | None]]
+    needs_request: bool
 
 
 ExpectedExceptionTypes = TypeVar("ExpectedExceptionTypes", bound=Exception)
@@ -143,6 +183,13 @@ class MockRouter(Generic[ExpectedExceptionTypes]):
             "PUT": [],
         }
 
+        # per-method alternation patterns combining all endpoint patterns,
+        # built lazily on first request and invalidated on registration
+        self._combined_patterns: dict[str, re.Pattern | None] = {}
+
+        # endpoints with parameterless paths, dispatched via exact lookup
+        self._literal_endpoints: dict[tuple[str, str], RegisteredEndpoint] = {}
+
     @staticmethod
     def _ensure_all_parameters_are_typed(
         endpoint_function: Callable, signature_parameters: dict[str, Any]
@@ -160,7 +207,10 @@ class MockRouter(Generic[ExpectedExceptionTypes]):
         Raises:
             TypeError: When one or more parameters are missing type-hint information.
         """
-        all_parameters = signature(endpoint_function).parameters
+        # read the parameter names off the code object, which is much cheaper
+        # than constructing a full inspect.Signature
+        code = endpoint_function.__code__
+        all_parameters = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
 
         for parameter in all_parameters:
             if parameter not in signature_parameters:
@@ -187,8 +237,8 @@ class MockRouter(Generic[ExpectedExceptionTypes]):
             param for param in signature_parameters if param != "request"
         }
         if endpoint_parameters:
-            # get set of parameters from path with brackets stripped
-            matches = {param.strip("{}") for param in re.findall(BRACKET_PATTERN, path)}
+            # get set of parameter names captured from the path
+            matches = set(re.findall(BRACKET_PATTERN, path))
 
             if matches != endpoint_parameters:
                 raise TypeError(
@@ -197,31 +247,52 @@ class MockRouter(Generic[ExpectedExceptionTypes]):
                 )
 
     def _add_endpoint(
-        self, method: str, path: str, endpoint_function: Callable
+        self,
+        method: str,
+        path: str,
+        endpoint_function: Callable,
+        signature_parameters: dict[str, Any],
     ) -> None:
         """Register an endpoint.
 
         Process the `path` and store the resulting endpoint according to `method`.
         """
-        signature_parameters: dict[str, Any] = _get_signature_info(endpoint_function)
-
         url_pattern = _compile_regex_url(path)
 
+        conversion_plan = [
+            (name, None if parameter_type is str else parameter_type)
+            for name, parameter_type in signature_parameters.items()
+            if name != "request"
+        ]
+
         registered_endpoint = RegisteredEndpoint(
             url_pattern=url_pattern,
+            compiled_pattern=_compile_pattern(url_pattern),
             endpoint_function=endpoint_function,
             signature_parameters=signature_parameters,
+            conversion_plan=conversion_plan,
+            needs_request="request" in signature_parameters,
         )
 
-        self._methods[method].append(registered_endpoint)
+        if "{" not in path:
+            # parameterless paths can be dispatched with a plain dict lookup
+            self._literal_endpoints[(method, path)] = registered_endpoint
+        else:
+            self._methods[method].append(registered_endpoint)
+            # force a rebuild of the combined pattern on the next request
+            self._combined_patterns.pop(method, None)
 
-    def _validate_endpoint(self, path: str, endpoint_function: Callable):
+    def _validate_endpoint(
+        self,
+        path: str,
+        endpoint_function: Callable,
+        signature_parameters: dict[str, Any],
+    ):
         """Perform validation on the endpoint before adding it.
 
         Verify that all the `endpoint_function` parameters are typed.
         Verify that the `path` parameter names match the `endpoint_function` signature.
         """
-        signature_parameters: dict[str, Any] = _get_signature_info(endpoint_function)
         self._ensure_all_parameters_are_typed(endpoint_function, signature_parameters)
         self._ensure_decorator_and_endpoint_parameters_match(path, signature_parameters)
 
@@ -232,9 +303,14 @@ class MockRouter(Generic[ExpectedExceptionTypes]):
 
         This is just moved out to avoid typing it in each of `get`, `delete`, `post`, etc.
         """
-        self._validate_endpoint(path, endpoint_function)
+        # resolve the type hints only once for both validation and registration
+        signature_parameters: dict[str, Any] = _get_signature_info(endpoint_function)
+        self._validate_endpoint(path, endpoint_function, signature_parameters)
         self._add_endpoint(
-            method=method, path=path, endpoint_function=endpoint_function
+            method=method,
+            path=path,
+            endpoint_function=endpoint_function,
+            signature_parameters=signature_parameters,
         )
         return endpoint_function
 
@@ -261,13 +337,13 @@ class MockRouter(Generic[ExpectedExceptionTypes]):
     @staticmethod
     def _convert_parameter_types(
         parsed_url_parameters: dict[str, str],
-        signature_parameters: dict[str, Any],
+        endpoint: RegisteredEndpoint,
         request: httpx.Request,
     ) -> dict[str, Any]:
-        """Get type info for function parameters.
+        """Get the typed parameters for the endpoint function.
 
-        Since the values parsed from the URL are still in string format, cast them to
-        the types specified in the signature.
+        Since the values parsed from the URL are still in string format, cast them
+        according to the conversion plan precomputed at registration time.
         If the request is needed, include that in the returned parameters.
 
         Args:
@@ -275,8 +351,8 @@ class MockRouter(Generic[ExpectedExceptionTypes]):
                 A dict containing the path variable names (keys) as specified in the
                 function decorator, and the values supplied for those variables in the
                 request still in string format (values).
-            signature_parameters:
-                A dict containing type information for the endpoint function's parameters.
+            endpoint:
+                The registered endpoint carrying the conversion plan.
             request:
                 The request object.
 
@@ -286,57 +362,85 @@ class MockRouter(Generic[ExpectedExceptionTypes]):
                 be converted/cast to the type specified by the type-hint for the
                 corresponding parameter.
         """
-        # type-cast based on type-hinting info
+        if not endpoint.conversion_plan:
+            # no casting needed, reuse the parsed parameters directly
+            if endpoint.needs_request:
+                parsed_url_parameters["request"] = request  # type: ignore[assignment]
+            return parsed_url_parameters
+
+        # type-cast based on the precomputed conversion plan
         typed_parameters: dict[str, Any] = {}
-        for parameter_name, value in parsed_url_parameters.items():
-            parameter_type = signature_parameters[parameter_name]
+        for parameter_name, caster in endpoint.conversion_plan:
+            value: Any = parsed_url_parameters[parameter_name]
 
-            if parameter_type is not str:
+            if caster is not None:
                 try:
-                    value = parameter_type(value)
+                    value = caster(value)
                 except ValueError as err:
                     raise HttpException(
                         status_code=422,
                         exception_id="malformedUrl",
                         description=(
-                            f"Unable to cast '{value}' to {parameter_type} for "
+                            f"Unable to cast '{value}' to {caster} for "
                             + f"path '{request.url.path}'"
                         ),
                         data={
                             "value": value,
-                            "parameter_type": parameter_type,
+                            "parameter_type": caster,
                             "path": request.url.path,
                         },
                     ) from err
             typed_parameters[parameter_name] = value
 
         # include request itself if needed (e.g. for header or auth info),
-        if "request" in signature_parameters:
+        if endpoint.needs_request:
             typed_parameters["request"] = request
 
         return typed_parameters
 
-    def _parse_url_parameters(
-        self, url: str, endpoint: RegisteredEndpoint
-    ) -> dict[str, str]:
-        """Produce a dict of path var names (keys) and request url values (values).
+    def _get_combined_pattern(self, method: str) -> re.Pattern | None:
+        """Get the combined pattern for all endpoints of the given method.
 
-        This should always match because we will have already performed the match in
-        _get_registered_endpoint.
+        The patterns of all endpoints registered for the method are merged
+        into a single alternation so that matching a request takes one regex
+        call instead of one call per registered endpoint. Each endpoint
+        pattern is wrapped in a sentinel group (_ep<index>) and its named
+        groups are prefixed accordingly so that group names stay unique
+        across the alternation. The combined pattern is cached until another
+        endpoint is registered for the method.
         """
-        matched_url = re.search(endpoint.url_pattern, url)
-        matched_url = cast(re.Match, matched_url)  # never None, make type checker happy
-        return matched_url.groupdict()
-
-    def _get_registered_endpoint(self, url: str, method: str) -> RegisteredEndpoint:
-        """Match request URL to a registered endpoint's url pattern.
-
-        Iterate through the registered endpoints for the given method.
-        For each registered endpoint, try to match the request's url to the endpoint
-        pattern. Upon matching, return the endpoint object.
+        try:
+            return self._combined_patterns[method]
+        except KeyError:
+            endpoints = self._methods[method]
+            pattern = (
+                re.compile(
+                    "|".join(
+                        f"(?P<_ep{index}>"
+                        + re.sub(r"\(\?P<", f"(?P<_ep{index}_", endpoint.url_pattern)
+                        + ")"
+                        for index, endpoint in enumerate(endpoints)
+                    )
+                )
+                if endpoints
+                else None
+            )
+            self._combined_patterns[method] = pattern
+            return pattern
+
+    def _match_endpoint(
+        self, path: str, method: str
+    ) -> tuple[RegisteredEndpoint, dict[str, str]]:
+        """Match request path to a registered endpoint's url pattern.
+
+        Run the combined pattern for the given method once and identify the
+        matched endpoint via its sentinel group. Return the endpoint object
+        together with the path parameters parsed from the path. Since the
+        patterns are anchored at both ends, matching starts at the beginning
+        of the path instead of scanning for a matching position.
 
         Args:
-            url: The url of the request.
+            path: The path portion of the request url.
             method: The method of the request.
 
         Raises:
@@ -344,41 +448,31 @@ class MockRouter(Generic[ExpectedExceptionTypes]):
                 (with status 404) when unable to find a registered endpoint with a
                 matching URL.
         """
-        for endpoint in self._methods[method]:
-            matched_url = re.search(endpoint.url_pattern, url)
-            if matched_url:
-                return endpoint
-
-        raise HttpException(
-            status_code=404,
-            exception_id="pageNotFound",
-            description=f"No registered path found for url '{url}' and method '{method}'",
-            data={"url": url, "method": method},
-        )
-
-    def _build_loaded_endpoint_function(self, request: httpx.Request) -> partial:
-        """Match a request to the correct endpoint.
-
-        Based on the endpoint matched, build the typed parameter dictionary and
-        return the loaded partial function.
-        """
-        url = str(request.url)
-
-        # get endpoint object that corresponds to the request URL
-        endpoint = self._get_registered_endpoint(url=url, method=request.method)
-
-        # get the parsed string parameters from the url
-        parsed_url_parameters = self._parse_url_parameters(url=url, endpoint=endpoint)
-
-        # convert parsed string parameters into the types specified in function signature
-        typed_parameters = self._convert_parameter_types(
-            parsed_url_parameters=parsed_url_parameters,
-            signature_parameters=endpoint.signature_parameters,
-            request=request,
-        )
-
-        # return function with the typed parameters loaded up
-        return partial(endpoint.endpoint_function, **typed_parameters)
+        combined_pattern = self._get_combined_pattern(method)
+        matched_url = combined_pattern.match(path) if combined_pattern else None
+
+        if not matched_url:
+            raise HttpException(
+                status_code=404,
+                exception_id="pageNotFound",
+                description=f"No registered path found for path '{path}' and method '{method}'",
+                data={"path": path, "method": method},
+            )
+
+        # the name of the last matched group carries the index of the
+        # matched alternative (it is either the sentinel group itself or
+        # one of the prefixed parameter groups)
+        last_group = cast(str, matched_url.lastgroup)
+        index = int(last_group[3:].split("_", 1)[0])
+        endpoint = self._methods[method][index]
+
+        prefix = f"_ep{index}_"
+        parsed_url_parameters = {
+            name: matched_url.group(prefix + name)
+            for name in endpoint.signature_parameters
+            if name != "request"
+        }
+        return endpoint, parsed_url_parameters
 
     def _should_pass_to_handler(self, exc: Exception):
         """Determine whether the provided exception should be passed to the handler."""
@@ -407,8 +501,28 @@ class MockRouter(Generic[ExpectedExceptionTypes]):
         re-raised.
         """
         try:
-            endpoint_function = self._build_loaded_endpoint_function(request)
-            return endpoint_function()
+            # route on the path only, without serializing the full URL
+            path = request.url.path
+
+            # try the exact lookup for parameterless paths first
+            endpoint = self._literal_endpoints.get((request.method, path))
+            if endpoint:
+                parsed_url_parameters: dict[str, str] = {}
+            else:
+                # fall back to regex matching against the parameterised endpoints
+                # to get the endpoint object together with the parsed parameters
+                endpoint, parsed_url_parameters = self._match_endpoint(
+                    path=path, method=request.method
+                )
+
+            # convert parsed string parameters into the types of the signature
+            typed_parameters = self._convert_parameter_types(
+                parsed_url_parameters=parsed_url_parameters,
+                endpoint=endpoint,
+                request=request,
+            )
+
+            return endpoint.endpoint_function(**typed_parameters)
         except Exception as exc:
             if self.exception_handler and self._should_pass_to_handler(exc):
                 exc = cast(
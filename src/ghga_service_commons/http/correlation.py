@@ -53,12 +53,19 @@ def attach_correlation_id_to_requests(
     *,
     generate_correlation_id: bool = True,
 ):
-    """Add an event hook to an httpx Client that includes the correlation ID header."""
+    """Add an event hook to an httpx Client that includes the correlation ID header.
+
+    If the hook is already attached to the client, it will not be added again,
+    so the header is never written multiple times per request.
+    """
+    request_hooks = client.event_hooks.setdefault("request", [])
+    if any(getattr(hook, "func", None) is _cid_request_hook for hook in request_hooks):
+        return
     event_hook = partial(
         _cid_request_hook,
         generate_correlation_id=generate_correlation_id,
     )
-    client.event_hooks.setdefault("request", []).append(event_hook)
+    request_hooks.append(event_hook)
 
 
 class AsyncClient(httpx.AsyncClient):
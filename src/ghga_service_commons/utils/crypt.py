@@ -19,6 +19,7 @@
 from __future__ import annotations
 
 import base64
+from functools import lru_cache
 from typing import NamedTuple
 
 from nacl.public import PrivateKey, PublicKey, SealedBox
@@ -28,7 +29,9 @@ __all__ = [
     "encode_key",
     "decode_key",
     "decrypt",
+    "decrypt_bytes",
     "encrypt",
+    "encrypt_bytes",
     "KeyPair",
 ]
 
@@ -59,6 +62,7 @@ def encode_key(key: bytes) -> str:
     return base64.b64encode(key).decode("ascii")
 
 
+@lru_cache(maxsize=128)
 def decode_key(key: str) -> bytes:
     """Base64 decode a private or public key.
 
@@ -76,12 +80,32 @@ def decode_key(key: str) -> bytes:
     return decoded_key
 
 
-def decrypt(
-    data: bytes | str, key: bytes | str | PrivateKey, encoding: str = "utf-8"
-) -> str:
-    """Decrypt a base64 encoded or bytes string using a private Crypt4GH key.
+@lru_cache(maxsize=128)
+def _sealed_box_for_private_key(key: PrivateKey) -> SealedBox:
+    """Get a SealedBox for the given private key, reusing boxes per key.
+
+    Since keys are typically reused across many calls, caching the box saves
+    the per-call box construction on top of the NaCl primitive.
+    """
+    return SealedBox(key)
+
+
+@lru_cache(maxsize=128)
+def _sealed_box_for_public_key(key: PublicKey) -> SealedBox:
+    """Get a SealedBox for the given public key, reusing boxes per key.
+
+    Since keys are typically reused across many calls, caching the box saves
+    the per-call box construction on top of the NaCl primitive.
+    """
+    return SealedBox(key)
 
-    The result will be decoded as a native string using the given encoding.
+
+def decrypt_bytes(data: bytes, key: bytes | str | PrivateKey) -> bytes:
+    """Decrypt raw bytes using a private Crypt4GH key.
+
+    The data must be the raw encrypted bytes (not base64 encoded) and the
+    raw decrypted bytes are returned. This avoids the base64 and text
+    encoding round trips for callers that already operate on bytes.
 
     Raises a ValueError if the given key cannot be used for decryption.
     """
@@ -91,19 +115,30 @@ def decrypt(
         key = PrivateKey(key)
     if not isinstance(key, PrivateKey):
         raise ValueError("Invalid key")
-    sealed_box = SealedBox(key)
+    sealed_box = _sealed_box_for_private_key(key)
+    return sealed_box.decrypt(data)
+
+
+def decrypt(
+    data: bytes | str, key: bytes | str | PrivateKey, encoding: str = "utf-8"
+) -> str:
+    """Decrypt a base64 encoded or bytes string using a private Crypt4GH key.
+
+    The result will be decoded as a native string using the given encoding.
+
+    Raises a ValueError if the given key cannot be used for decryption.
+    """
     if isinstance(data, str):
         data = base64.b64decode(data)
-    decrypted_data = sealed_box.decrypt(data)
-    return decrypted_data.decode(encoding)
+    return decrypt_bytes(data, key).decode(encoding)
 
 
-def encrypt(
-    data: str, key: bytes | str | PrivateKey | PublicKey, encoding: str = "utf-8"
-) -> str:
-    """Encrypt a str with given encoding using a public Crypt4GH key.
+def encrypt_bytes(data: bytes, key: bytes | str | PrivateKey | PublicKey) -> bytes:
+    """Encrypt raw bytes using a public Crypt4GH key.
 
-    The result will be returned as a base64 encoded string.
+    The raw encrypted bytes are returned (not base64 encoded). This avoids
+    the base64 and text encoding round trips for callers that already
+    operate on bytes.
 
     Raises a ValueError if the given key cannot be used for encryption.
 
@@ -118,7 +153,21 @@ def encrypt(
         key = key.public_key
     if not isinstance(key, PublicKey):
         raise ValueError("Invalid key")
-    sealed_box = SealedBox(key)
-    decoded_data = bytes(data, encoding=encoding)
-    encrypted_data = sealed_box.encrypt(decoded_data)
+    sealed_box = _sealed_box_for_public_key(key)
+    return sealed_box.encrypt(data)
+
+
+def encrypt(
+    data: str, key: bytes | str | PrivateKey | PublicKey, encoding: str = "utf-8"
+) -> str:
+    """Encrypt a str with given encoding using a public Crypt4GH key.
+
+    The result will be returned as a base64 encoded string.
+
+    Raises a ValueError if the given key cannot be used for encryption.
+
+    A PrivateKey object can be passed as key as well, then the derived public key
+    will be used for the encryption.
+    """
+    encrypted_data = encrypt_bytes(bytes(data, encoding=encoding), key)
     return base64.b64encode(encrypted_data).decode("ascii")
@@ -29,8 +29,6 @@ import crypt4gh.header
 import crypt4gh.lib
 from crypt4gh.keys import c4gh, get_private_key, get_public_key
 
-from ghga_service_commons.utils.temp_files import big_temp_file
-
 __all__ = [
     "Crypt4GHKeyPair",
     "create_envelope",
@@ -164,16 +162,17 @@ def generate_keypair() -> Crypt4GHKeyPair:
 def random_encrypted_content(
     file_size: int, private_key: str | bytes, public_key: str | bytes
 ) -> RandomEncryptedData:
-    """Create an in-memory file with random content that is Crypt4GH encrypted."""
+    """Create an in-memory file with arbitrary content that is Crypt4GH encrypted.
+
+    The unencrypted content is an all-zero buffer of exactly the given size,
+    which is created in memory without touching the disk.
+    """
     encrypted_file = io.BytesIO()
 
-    with big_temp_file(file_size) as raw_file:
-        # rewind input file for reading
-        true_size = raw_file.tell()
-        raw_file.seek(0)
-        keys = [(0, private_key, public_key)]
-        crypt4gh.lib.encrypt(keys=keys, infile=raw_file, outfile=encrypted_file)
+    raw_file = io.BytesIO(bytes(file_size))
+    keys = [(0, private_key, public_key)]
+    crypt4gh.lib.encrypt(keys=keys, infile=raw_file, outfile=encrypted_file)
 
     # rewind output file for reading
     encrypted_file.seek(0)
-    return RandomEncryptedData(content=encrypted_file, decrypted_size=true_size)
+    return RandomEncryptedData(content=encrypted_file, decrypted_size=file_size)
@@ -26,8 +26,15 @@ from .utc_dates import now_as_utc
 __all__ = ["generate_jwk", "sign_and_serialize_token", "decode_and_validate_token"]
 
 
-def generate_jwk() -> jwk.JWK:
-    """Generate a random EC based JWK."""
+def generate_jwk(symmetric: bool = False) -> jwk.JWK:
+    """Generate a random EC based JWK.
+
+    If symmetric is set, a random symmetric (oct) key is generated instead.
+    Such keys allow much cheaper HMAC based signing and validation, but must
+    only be used when tokens are signed and validated by the same service.
+    """
+    if symmetric:
+        return jwk.JWK.generate(kty="oct", size=256)
     return jwk.JWK.generate(kty="EC", crv="P-256")
 
 
@@ -35,7 +42,7 @@ def sign_and_serialize_token(
     claims: dict[str, Any], key: jwk.JWK, valid_seconds: int = 60 * 10
 ) -> str:
     """Create a signed JSON Web Token that can be used for testing."""
-    header = {"alg": "ES256"}
+    header = {"alg": "HS256" if key["kty"] == "oct" else "ES256"}
     iat = int(now_as_utc().timestamp())
     exp = iat + valid_seconds
     claims = {**claims, "iat": iat, "exp": exp}
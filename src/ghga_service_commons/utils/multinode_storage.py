@@ -67,8 +67,18 @@ class S3ObjectStorages(ObjectStorages):
 
     def __init__(self, *, config: S3ObjectStoragesConfig):
         self._config = config
+        self._storages: dict[str, S3ObjectStorage] = {}
 
     def for_alias(self, endpoint_alias: str) -> tuple[str, S3ObjectStorage]:
-        """Get bucket ID and object storage instance for a specific alias."""
+        """Get bucket ID and object storage instance for a specific alias.
+
+        The object storage instance for each alias is created on first use
+        and then reused, so that repeated lookups for the same alias share
+        the same underlying client.
+        """
         node_config = self._config.object_storages[endpoint_alias]
-        return node_config.bucket, S3ObjectStorage(config=node_config.credentials)
+        storage = self._storages.get(endpoint_alias)
+        if storage is None:
+            storage = S3ObjectStorage(config=node_config.credentials)
+            self._storages[endpoint_alias] = storage
+        return node_config.bucket, storage
@@ -34,8 +34,23 @@ class NamedBinaryIO(ABC, BinaryIO):
 
 
 @contextmanager
-def big_temp_file(size: int) -> Generator[NamedBinaryIO, None, None]:
-    """Generate a big file with approximately the specified size in bytes."""
+def big_temp_file(
+    size: int, *, content: bool = True
+) -> Generator[NamedBinaryIO, None, None]:
+    """Generate a big file with approximately the specified size in bytes.
+
+    If content is set to False, a sparse file of exactly the given size is
+    allocated instead of writing number lines. This is practically
+    instantaneous regardless of the size, but the file reads as all zero
+    bytes, so it should only be used when the content does not matter.
+    """
+    if not content:
+        with NamedTemporaryFile("w+b") as temp_file:
+            temp_file.truncate(size)
+            temp_file.seek(size)
+            yield cast(NamedBinaryIO, temp_file)
+        return
+
     max_size = 2**31 - 1
     original_max = sys.get_int_max_str_digits()
     sys.set_int_max_str_digits(max_size)
@@ -43,15 +58,22 @@ def big_temp_file(size: int) -> Generator[NamedBinaryIO, None, None]:
     current_size = 0
     current_number = 0
     next_number = 1
+    buffer = bytearray()
+    buffer_size = 1 << 20  # accumulate 1 MiB in memory before writing to disk
     with NamedTemporaryFile("w+b") as temp_file:
         while current_size <= size:
-            byte_addition = f"{current_number}\n".encode("ASCII")
+            byte_addition = b"%d\n" % current_number
             current_size += len(byte_addition)
-            temp_file.write(byte_addition)
+            buffer += byte_addition
+            if len(buffer) >= buffer_size:
+                temp_file.write(buffer)
+                buffer.clear()
             previous_number = current_number
             current_number = next_number
             next_number = previous_number + current_number
 
+        if buffer:
+            temp_file.write(buffer)
         temp_file.flush()
         sys.set_int_max_str_digits(original_max)
         yield cast(NamedBinaryIO, temp_file)
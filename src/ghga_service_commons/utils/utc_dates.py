@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
 from typing import Annotated
 
@@ -32,14 +33,40 @@ def assert_tz_is_utc() -> None:
     """Verify that the default timezone is set to UTC.
 
     Raise a RuntimeError if the default timezone is set differently.
+
+    This inspects the timezone globals of the time module directly instead
+    of deriving a local datetime, which requires no allocations at all.
     """
-    if datetime.now().astimezone().tzinfo != UTC:
+    if time.timezone or time.daylight:
         raise RuntimeError("System must be configured to use UTC.")
 
 
 def convert_tz_to_utc(date: datetime) -> datetime:
-    """Convert the timezone of the given datetime object to UTC."""
-    return date.astimezone(UTC) if date.tzinfo is not UTC else date
+    """Convert the timezone of the given datetime object to UTC.
+
+    Datetimes that already have a zero UTC offset (no matter via which
+    tzinfo implementation) are returned unchanged, avoiding the allocation
+    of a new datetime object on the common "already UTC" path.
+    """
+    offset = date.utcoffset()
+    if offset is not None and not offset:
+        return date
+    return date.astimezone(UTC)
+
+
+_validate_aware_datetime = TypeAdapter(AwareDatetime).validate_python
+
+
+def _ensure_aware_datetime(value) -> datetime:
+    """Coerce the given value to a timezone aware datetime.
+
+    Values that already are aware datetimes (the common case) are passed
+    through directly; everything else goes through the generic pydantic
+    validator, which is considerably slower.
+    """
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value
+    return _validate_aware_datetime(value)
 
 
 # A Pydantic type for values that should have an UTC timezone.
@@ -51,7 +78,7 @@ UTCDatetime = Annotated[
     datetime,
     # note that BeforeValidators run right-to-left
     BeforeValidator(convert_tz_to_utc),
-    BeforeValidator(TypeAdapter(AwareDatetime).validate_python),
+    BeforeValidator(_ensure_aware_datetime),
 ]
 
 
@@ -59,7 +86,7 @@ def utc_datetime(*args, **kwargs) -> UTCDatetime:
     """Construct a datetime with UTC timezone."""
     if kwargs.get("tzinfo") is None:
         kwargs["tzinfo"] = UTC
-    return UTCDatetime(*args, **kwargs)
+    return datetime(*args, **kwargs)
 
 
 def now_as_utc() -> UTCDatetime:
@@ -67,4 +94,4 @@ def now_as_utc() -> UTCDatetime:
 
     Note: This is different from datetime.utcnow() which has no timezone.
     """
-    return UTCDatetime.now(UTC)
+    return datetime.now(UTC)
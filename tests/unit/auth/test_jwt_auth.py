@@ -132,6 +132,30 @@ async def test_admin_context(jwt_auth):
     assert str(context.expiry - context.issued) == "0:10:00"
 
 
+@mark.asyncio
+async def test_context_caching(jwt_auth):
+    """Test that validated auth contexts are cached per token."""
+    token = create_token()
+    context = await jwt_auth.get_context(token)
+    assert isinstance(context, AuthContext)
+    context_again = await jwt_auth.get_context(token)
+    assert context_again is context
+    other_context = await jwt_auth.get_context(create_token("Jane Roe"))
+    assert other_context is not context
+
+
+@mark.asyncio
+async def test_context_caching_can_be_disabled():
+    """Test that caching of auth contexts can be switched off."""
+    config = AuthConfig(auth_cache_size=0)
+    jwt_auth = JWTAuthContextProvider(config=config, context_class=AuthContext)
+    token = create_token()
+    context = await jwt_auth.get_context(token)
+    context_again = await jwt_auth.get_context(token)
+    assert context_again is not context
+    assert context_again == context
+
+
 @mark.asyncio
 async def test_empty_token(jwt_auth):
     """Test getting an auth context with empty token."""
@@ -25,8 +25,10 @@ from ghga_service_commons.utils.crypt import (
     KeyPair,
     decode_key,
     decrypt,
+    decrypt_bytes,
     encode_key,
     encrypt,
+    encrypt_bytes,
     generate_key_pair,
 )
 
@@ -191,6 +193,24 @@ def test_encrypted_is_encoded_and_raw_data_can_be_decrypted():
     assert decrypted == message
 
 
+def test_encryption_and_decryption_with_bytes():
+    """Test encrypting and decrypting raw bytes without base64 round trips."""
+    key_pair = generate_key_pair()
+
+    message = b"Foo bar baz!"
+
+    encrypted = encrypt_bytes(message, key_pair.public)
+    assert isinstance(encrypted, bytes)
+    assert encrypted != message
+
+    decrypted = decrypt_bytes(encrypted, key_pair.private)
+    assert isinstance(decrypted, bytes)
+    assert decrypted == message
+
+    # the str interface must be able to decrypt the same raw bytes
+    assert decrypt(encrypted, key_pair.private) == "Foo bar baz!"
+
+
 def test_encryption_and_decryption_with_non_ascii_data():
     """Test encrypting and decrypting a non ASCII message with raw keys."""
     key_pair = generate_key_pair()
@@ -49,3 +49,22 @@ def test_sign_and_validate():
     token = token[:-3] + last_chars
     with raises(JWException):
         decode_and_validate_token(token, key)
+
+
+def test_sign_and_validate_symmetric():
+    """Test that tokens can also be signed and validated with symmetric keys."""
+    key = generate_jwk(symmetric=True)
+    key_dict = key.export(as_dict=True)
+    assert isinstance(key_dict, dict)
+    assert key_dict["kty"] == "oct"
+    assert key_dict["k"]
+    claims = {"name": "John Doe", "role": "admin"}
+    token = sign_and_serialize_token(claims, key, valid_seconds=300)
+    assert isinstance(token, str)
+    assert token.count(".") == 2
+    token_dict = decode_and_validate_token(token, key)
+    assert isinstance(token_dict, dict)
+    assert token_dict.pop("exp") - token_dict.pop("iat") == 300
+    assert token_dict == claims
+    with raises(JWException):
+        decode_and_validate_token(token, generate_jwk(symmetric=True))
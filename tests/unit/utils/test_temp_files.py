@@ -26,3 +26,13 @@ def test_big_temp_file():
         file_content = temp_file.read()
         assert file_content.isascii()
         assert 42 <= len(file_content) < 50
+
+
+def test_big_temp_file_without_content():
+    """Test that a sparse file of the exact size can be generated."""
+    with big_temp_file(42, content=False) as temp_file:
+        assert temp_file.name.isascii()
+        assert temp_file.tell() == 42
+        temp_file.seek(0)
+        file_content = temp_file.read()
+        assert file_content == b"\0" * 42